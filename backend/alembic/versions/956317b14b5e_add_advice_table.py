@@ -0,0 +1,45 @@
+"""Add advice table
+
+Revision ID: 956317b14b5e
+Revises: fbad6eba1e93
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '956317b14b5e'
+down_revision: Union[str, Sequence[str], None] = 'fbad6eba1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('advice',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('home_id', sa.UUID(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('prompt_hash', sa.String(length=64), nullable=False),
+    sa.Column('recommendations', sa.JSON(), nullable=False),
+    sa.Column('total_cost_min', sa.Float(), nullable=True),
+    sa.Column('total_cost_max', sa.Float(), nullable=True),
+    sa.Column('total_savings_min', sa.Float(), nullable=True),
+    sa.Column('total_savings_max', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['home_id'], ['homes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_advice_home_id_created_at', 'advice', ['home_id', 'created_at'], unique=False)
+    op.create_index('ix_advice_prompt_hash', 'advice', ['prompt_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_advice_prompt_hash', table_name='advice')
+    op.drop_index('ix_advice_home_id_created_at', table_name='advice')
+    op.drop_table('advice')
@@ -1,4 +1,5 @@
 from app.interfaces.home_service_interface import HomeServiceInterface
 from app.interfaces.llm_service_interface import LLMServiceInterface
+from app.interfaces.advice_service_interface import AdviceServiceInterface
 
-__all__ = ["HomeServiceInterface", "LLMServiceInterface"]
\ No newline at end of file
+__all__ = ["HomeServiceInterface", "LLMServiceInterface", "AdviceServiceInterface"]
\ No newline at end of file
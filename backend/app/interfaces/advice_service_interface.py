@@ -0,0 +1,23 @@
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.models.advice_model import Advice
+from app.schemas.advice_schema import Recommendation
+
+
+class AdviceServiceInterface(ABC):    
+    @abstractmethod
+    async def save_advice(
+        self,
+        home_id: str,
+        model: str,
+        prompt_hash: str,
+        recommendations: List[Recommendation]
+    ) -> Advice:
+        pass
+    
+    @abstractmethod
+    async def get_latest_advice(self, home_id: str) -> Optional[Advice]:
+        pass
+    
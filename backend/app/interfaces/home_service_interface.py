@@ -1,5 +1,7 @@
 
 from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
 
 from app.models.home_model import Home
 from app.schemas.home_schema import HomeCreate
@@ -14,3 +16,7 @@ class HomeServiceInterface(ABC):
     async def get_home(self, home_id: str) -> Home:
         pass
     
+    @abstractmethod
+    async def create_homes_bulk(self, homes: List[HomeCreate]) -> List[UUID]:
+        pass
+    
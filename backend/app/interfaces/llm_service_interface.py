@@ -1,6 +1,6 @@
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 
 from app.models.home_model import Home
 
@@ -10,6 +10,10 @@ class LLMServiceInterface(ABC):
     def create_energy_prompt(self, home: Home) -> str:
         pass
     
+    @abstractmethod
+    def open_recommendations_stream(self, home: Home) -> AsyncIterator[str]:
+        pass
+    
     @abstractmethod
     async def generate_recommendations_stream(
         self, 
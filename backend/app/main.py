@@ -1,10 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import httpx
 
 from app.shared.shared_config import settings
 from app.shared.database import engine, Base
+from app.shared.http_client import create_http_client, get_pool_stats
+from app.shared.dependencies import get_advice_cache, get_single_flight, get_admission_controller
 from app.routes.v1 import router as v1_router
 
 
@@ -14,10 +15,14 @@ async def lifespan(app: FastAPI):
     # Startup
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+    app.state.http_client = create_http_client()
     
     yield
     
     # Shutdown
+    await get_single_flight().shutdown()
+    await app.state.http_client.aclose()
     await engine.dispose()
 
 
@@ -44,15 +49,19 @@ app.include_router(v1_router, prefix=settings.API_V1_STR)
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    client = app.state.http_client
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{settings.OLLAMA_BASE_URL}/api/tags")
-            ollama_status = "connected" if response.status_code == 200 else "error"
+        response = await client.get(f"{settings.OLLAMA_BASE_URL}/api/tags", timeout=5.0)
+        ollama_status = "connected" if response.status_code == 200 else "error"
     except:
         ollama_status = "disconnected"
     
     return {
         "status": "healthy",
         "app": settings.APP_NAME,
-        "ollama": ollama_status
+        "ollama": ollama_status,
+        "http_pool": get_pool_stats(client),
+        "advice_cache": get_advice_cache().stats(),
+        "single_flight": get_single_flight().stats(),
+        "admission": get_admission_controller().stats()
     }
@@ -1,3 +1,4 @@
 from app.models.home_model import Home
+from app.models.advice_model import Advice
 
-__all__ = ["Home"]
\ No newline at end of file
+__all__ = ["Home", "Advice"]
\ No newline at end of file
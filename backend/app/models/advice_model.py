@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Float, DateTime, UUID, JSON, ForeignKey, Index
+from sqlalchemy.sql import func
+from datetime import datetime, timezone
+from uuid import uuid4
+from app.shared.database import Base
+
+
+class Advice(Base):
+    __tablename__ = "advice"
+
+    id = Column(UUID, primary_key=True, default=uuid4, nullable=False)
+    home_id = Column(UUID, ForeignKey("homes.id", ondelete="CASCADE"), nullable=False)
+    model = Column(String, nullable=False)
+    prompt_hash = Column(String(64), nullable=False)
+    recommendations = Column(JSON, nullable=False)
+
+    # Totals over all recommendations, parsed from the LLM's cost/savings strings
+    total_cost_min = Column(Float, nullable=True)
+    total_cost_max = Column(Float, nullable=True)
+    total_savings_min = Column(Float, nullable=True)
+    total_savings_max = Column(Float, nullable=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    __table_args__ = (
+        # Latest advice per home is a single index lookup
+        Index("ix_advice_home_id_created_at", "home_id", "created_at"),
+        Index("ix_advice_prompt_hash", "prompt_hash"),
+    )
+
+    def __repr__(self):
+        return f"<Advice {self.id} - home {self.home_id}>"
@@ -3,8 +3,10 @@ from fastapi.responses import StreamingResponse
 
 from app.interfaces.home_service_interface import HomeServiceInterface
 from app.interfaces.llm_service_interface import LLMServiceInterface
-from app.shared.dependencies import get_home_service, get_llm_service
-from app.utils.exception_helper import NotFoundException
+from app.interfaces.advice_service_interface import AdviceServiceInterface
+from app.schemas.advice_schema import AdviceResponse
+from app.shared.dependencies import get_home_service, get_llm_service, get_advice_service
+from app.utils.exception_helper import NotFoundException, ServiceOverloadedException
 
 router = APIRouter()
 
@@ -37,8 +39,17 @@ async def get_energy_advice(
             detail="No home found!"
         )
     
+    try:
+        stream = llm_service.open_recommendations_stream(home)
+    except ServiceOverloadedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    
     return StreamingResponse(
-        llm_service.generate_recommendations_stream(home),
+        stream,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -46,3 +57,39 @@ async def get_energy_advice(
             "X-Accel-Buffering": "no"
         }
     )
+
+
+@router.get(
+    "/{home_id}/advice",
+    response_model=AdviceResponse,
+    summary="Get the latest stored energy advice"
+)
+async def get_latest_advice(
+    home_id: str,
+    advice_service: AdviceServiceInterface = Depends(get_advice_service)
+):
+    """
+    Return the most recently generated recommendations for a home
+    without calling the LLM.
+    """
+    try:
+        advice = await advice_service.get_latest_advice(home_id)
+    except ValueError:
+        advice = None
+
+    if advice is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No advice found for this home!"
+        )
+
+    return AdviceResponse(
+        home_id=str(advice.home_id),
+        recommendations=advice.recommendations,
+        generated_at=advice.created_at,
+        model=advice.model,
+        total_cost_min=advice.total_cost_min,
+        total_cost_max=advice.total_cost_max,
+        total_savings_min=advice.total_savings_min,
+        total_savings_max=advice.total_savings_max,
+    )
@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from typing import AsyncGenerator, List, Tuple
+import json
+import time
 import logging
 
 from app.schemas.home_schema import HomeCreate, HomeResponse
 from app.interfaces.home_service_interface import HomeServiceInterface
 from app.shared.dependencies import get_home_service
+from app.shared.shared_config import settings
+from app.utils.json_stream import iter_json_records
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +50,116 @@ async def create_home(
     raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post(
+    "/bulk",
+    summary="Bulk create home profiles (JSON array or NDJSON)"
+)
+async def create_homes_bulk(
+    request: Request,
+    home_service: HomeServiceInterface = Depends(get_home_service)
+):
+    """
+    Create many home profiles from a streamed request body:
+
+    - **application/json**: a JSON array of home objects
+    - **application/x-ndjson**: one home object per line
+
+    Rows are validated and inserted in batches of `BULK_INSERT_BATCH_SIZE`, each
+    batch in its own transaction. The response streams one NDJSON result per
+    row (`index`, `status`, `id` or `errors`) followed by a `summary` line.
+    """
+    content_type = request.headers.get("content-type", "")
+    ndjson = "ndjson" in content_type or "jsonl" in content_type
+
+    return StreamingResponse(
+        _bulk_create_results(request, home_service, ndjson),
+        media_type="application/x-ndjson"
+    )
+
+
+def _result_line(result: dict) -> str:
+    return json.dumps(result, separators=(",", ":")) + "\n"
+
+
+async def _insert_batch(
+    home_service: HomeServiceInterface,
+    batch: List[Tuple[int, HomeCreate]]
+) -> List[dict]:
+    try:
+        ids = await home_service.create_homes_bulk([home for _, home in batch])
+    except Exception:
+        logger.exception(f"Bulk insert of {len(batch)} homes failed")
+        return [
+            {"index": index, "status": "error", "errors": [{"msg": "Database error, batch rolled back"}]}
+            for index, _ in batch
+        ]
+    return [
+        {"index": index, "status": "created", "id": str(home_id)}
+        for (index, _), home_id in zip(batch, ids)
+    ]
+
+
+async def _bulk_create_results(
+    request: Request,
+    home_service: HomeServiceInterface,
+    ndjson: bool
+) -> AsyncGenerator[str, None]:
+    started = time.perf_counter()
+    batch: List[Tuple[int, HomeCreate]] = []
+    received = created = failed = 0
+
+    async def flush() -> List[dict]:
+        nonlocal created, failed
+        results = await _insert_batch(home_service, batch)
+        batch.clear()
+        for result in results:
+            if result["status"] == "created":
+                created += 1
+            else:
+                failed += 1
+        return results
+
+    async for record in iter_json_records(request.stream(), ndjson=ndjson):
+        index = received
+        received += 1
+
+        if isinstance(record, ValueError):
+            failed += 1
+            yield _result_line({"index": index, "status": "error", "errors": [{"msg": str(record)}]})
+            continue
+
+        try:
+            home = HomeCreate.model_validate(record)
+        except ValidationError as e:
+            failed += 1
+            errors = [{"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors()]
+            yield _result_line({"index": index, "status": "error", "errors": errors})
+            continue
+
+        if home.location is None:
+            failed += 1
+            yield _result_line({"index": index, "status": "error", "errors": [{"loc": ["location"], "msg": "Field required"}]})
+            continue
+
+        batch.append((index, home))
+        if len(batch) >= settings.BULK_INSERT_BATCH_SIZE:
+            for result in await flush():
+                yield _result_line(result)
+
+    if batch:
+        for result in await flush():
+            yield _result_line(result)
+
+    elapsed = time.perf_counter() - started
+    yield _result_line({"summary": {
+        "received": received,
+        "created": created,
+        "failed": failed,
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "homes_per_second": round(created / elapsed, 1) if elapsed > 0 else 0.0,
+    }})
+
+
 @router.get(
     "/{home_id}",
     response_model=HomeResponse,
@@ -32,7 +32,9 @@ from enum import Enum
 
 class MessageType(str, Enum):
     CONNECTED = "connected"
+    QUEUED = "queued"
     RECOMMENDATION = "recommendation"
+    PROGRESS = "progress"
     COMPLETE = "complete"
     ERROR = "error"
 
@@ -62,9 +64,22 @@ class Recommendation(BaseModel):
     category: Category
 
 
+class GenerationProgress(BaseModel):
+    tokens: int
+    tokens_per_second: float
+    elapsed_ms: int
+
+
+class QueueStatus(BaseModel):
+    position: int
+    estimated_wait_seconds: float
+
+
 class SSEMessage(BaseModel):
     type: MessageType
     recommendation: Optional[Recommendation] = None
+    progress: Optional[GenerationProgress] = None
+    queue: Optional[QueueStatus] = None
     home_id: Optional[str] = None
     error: Optional[str] = None
 
@@ -72,4 +87,9 @@ class SSEMessage(BaseModel):
 class AdviceResponse(BaseModel):
     home_id: str
     recommendations: List[Recommendation]
-    generated_at: datetime
\ No newline at end of file
+    generated_at: datetime
+    model: Optional[str] = None
+    total_cost_min: Optional[float] = None
+    total_cost_max: Optional[float] = None
+    total_savings_min: Optional[float] = None
+    total_savings_max: Optional[float] = None
\ No newline at end of file
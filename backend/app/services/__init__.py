@@ -1,4 +1,5 @@
 from app.services.home_service import HomeService
 from app.services.llm_service import LLMService
+from app.services.advice_service import AdviceService
 
-__all__ = ["HomeService", "LLMService"]
\ No newline at end of file
+__all__ = ["HomeService", "LLMService", "AdviceService"]
\ No newline at end of file
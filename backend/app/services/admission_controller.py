@@ -0,0 +1,138 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import AsyncGenerator, Deque, Optional
+import logging
+
+from app.utils.exception_helper import ServiceOverloadedException
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+
+class AdmissionTicket:
+    """A reserved place in the generation queue (or a running slot once admitted)"""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self.reserved_at = time.monotonic()
+        self.admitted_at: Optional[float] = None
+        self.released = False
+        self._admitted = asyncio.get_running_loop().create_future()
+
+    @property
+    def admitted(self) -> bool:
+        return self._admitted.done()
+
+    def position(self) -> int:
+        """1-based position in the waiting queue, 0 once admitted"""
+        if self.admitted:
+            return 0
+        return self._controller._waiting.index(self) + 1
+
+    async def wait(self, update_interval: float) -> AsyncGenerator[int, None]:
+        """Wait for a running slot, yielding the queue position whenever it changes"""
+        last_position = None
+        try:
+            while not self.admitted:
+                position = self.position()
+                if position != last_position:
+                    last_position = position
+                    yield position
+                await asyncio.wait({self._admitted}, timeout=update_interval)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self._controller._release(self)
+
+
+class AdmissionController:
+    """Bounded concurrency in front of Ollama with a bounded FIFO waiting queue"""
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue: int,
+        initial_generation_seconds: float = 20.0,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+
+        self._running = 0
+        self._waiting: Deque[AdmissionTicket] = deque()
+        # Moving average of how long a generation holds its slot
+        self._avg_generation_seconds = initial_generation_seconds
+
+        self.admitted = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def reserve(self) -> AdmissionTicket:
+        """Take a running slot or a place in the queue; raises when the queue is full"""
+        ticket = AdmissionTicket(self)
+        if self._running < self.max_in_flight and not self._waiting:
+            self._admit(ticket)
+            return ticket
+
+        if len(self._waiting) >= self.max_queue:
+            self.rejected += 1
+            retry_after = math.ceil(self.estimated_wait(len(self._waiting) + 1))
+            logger.warning(f"Generation queue full ({len(self._waiting)} waiting), rejecting request")
+            raise ServiceOverloadedException(
+                "Too many advice requests in progress. Please try again later.",
+                retry_after=max(retry_after, 1),
+            )
+
+        self._waiting.append(ticket)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiting))
+        return ticket
+
+    def estimated_wait(self, position: int) -> float:
+        """Seconds until the ticket at ``position`` gets a slot, assuming average generations"""
+        if position <= 0:
+            return 0.0
+        rounds = math.ceil(position / self.max_in_flight)
+        return round(rounds * self._avg_generation_seconds, 1)
+
+    def _admit(self, ticket: AdmissionTicket) -> None:
+        self._running += 1
+        self.admitted += 1
+        ticket.admitted_at = time.monotonic()
+        waited = ticket.admitted_at - ticket.reserved_at
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        ticket._admitted.set_result(None)
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        if not ticket.admitted:
+            # Gave up while still queued
+            self._waiting.remove(ticket)
+            return
+
+        self._running -= 1
+        held = time.monotonic() - ticket.admitted_at
+        self._avg_generation_seconds = 0.8 * self._avg_generation_seconds + 0.2 * held
+
+        while self._waiting and self._running < self.max_in_flight:
+            self._admit(self._waiting.popleft())
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self._running,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": len(self._waiting),
+            "max_queue": self.max_queue,
+            "max_queue_depth_seen": self.max_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.admitted, 3) if self.admitted else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "avg_generation_seconds": round(self._avg_generation_seconds, 3),
+        }
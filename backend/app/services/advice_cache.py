@@ -0,0 +1,48 @@
+import hashlib
+import json
+from typing import List, Optional
+import logging
+
+from app.schemas.advice_schema import SSEMessage
+from app.utils.ttl_cache import TTLCache
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+
+def make_advice_cache_key(prompt: str, model: str, options: dict) -> str:
+    """Content address of a generation: rendered prompt + model + generation options"""
+    payload = json.dumps(
+        {"prompt": prompt, "model": model, "options": options},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AdviceCache:
+    """Caches the generated SSE events (recommendations + complete) per prompt"""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self._cache = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+        )
+
+    def get(self, key: str) -> Optional[List[SSEMessage]]:
+        return self._cache.get(key)
+
+    def put(self, key: str, messages: List[SSEMessage]) -> None:
+        size = sum(len(msg.model_dump_json()) for msg in messages)
+        if not self._cache.set(key, tuple(messages), size=size):
+            logger.warning(f"Advice for key {key[:12]} is too large to cache ({size} bytes)")
+
+    def invalidate(self, key: str) -> bool:
+        return self._cache.invalidate(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
@@ -0,0 +1,87 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
+from uuid import UUID
+import logging
+
+from app.interfaces.advice_service_interface import AdviceServiceInterface
+from app.models.advice_model import Advice
+from app.schemas.advice_schema import Recommendation
+from app.utils.money_parser import parse_money_range
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def _sum_bound(values: List[Optional[float]]) -> Optional[float]:
+    known = [value for value in values if value is not None]
+    return round(sum(known), 2) if known else None
+
+
+class AdviceService(AdviceServiceInterface):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save_advice(
+        self,
+        home_id: str,
+        model: str,
+        prompt_hash: str,
+        recommendations: List[Recommendation]
+    ) -> Advice:
+        if not recommendations:
+            logger.error("No recommendations to save")
+            raise ValueError("Recommendations must not be empty")
+
+        try:
+            items = []
+            for rec in recommendations:
+                cost_min, cost_max = parse_money_range(rec.estimated_cost)
+                savings_min, savings_max = parse_money_range(rec.estimated_savings)
+                items.append({
+                    **rec.model_dump(mode="json"),
+                    "cost_min": cost_min,
+                    "cost_max": cost_max,
+                    "savings_min": savings_min,
+                    "savings_max": savings_max,
+                })
+
+            advice = Advice(
+                home_id=UUID(str(home_id)),
+                model=model,
+                prompt_hash=prompt_hash,
+                recommendations=items,
+                total_cost_min=_sum_bound([item["cost_min"] for item in items]),
+                total_cost_max=_sum_bound([item["cost_max"] for item in items]),
+                total_savings_min=_sum_bound([item["savings_min"] for item in items]),
+                total_savings_max=_sum_bound([item["savings_max"] for item in items]),
+            )
+
+            self.db.add(advice)
+            await self.db.flush()
+
+            logger.info(f"Advice saved for home {home_id} - ID: {advice.id}")
+            return advice
+
+        except Exception as e:
+            logger.error(f"Error saving advice for home {home_id}: {str(e)}", exc_info=True)
+            raise
+
+    async def get_latest_advice(self, home_id: str) -> Optional[Advice]:
+        if home_id is None:
+            logger.error("Home id is null")
+            raise ValueError("Home id can't be null")
+
+        try:
+            # Served from ix_advice_home_id_created_at
+            result = await self.db.execute(
+                select(Advice)
+                .where(Advice.home_id == UUID(str(home_id)))
+                .order_by(Advice.created_at.desc())
+                .limit(1)
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(f"Error fetching advice for home {home_id}: {str(e)}", exc_info=True)
+            raise
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from typing import List
+from uuid import UUID, uuid4
 import logging
 
 from app.interfaces.home_service_interface import HomeServiceInterface
@@ -56,5 +57,29 @@ class HomeService(HomeServiceInterface):
         except Exception as e:
             logger.error(f"Error fetching home profile {home_id}: {str(e)}", exc_info=True)
             raise
-    
-    
\ No newline at end of file
+
+    async def create_homes_bulk(self, homes: List[HomeCreate]) -> List[UUID]:
+        """Insert a batch of homes with one multi-row INSERT ... RETURNING and commit it"""
+        if not homes:
+            return []
+
+        try:
+            rows = [{"id": uuid4(), **home.model_dump()} for home in homes]
+
+            # insertmanyvalues renders multi-row VALUES batches; RETURNING rows
+            # come back in parameter order so they map onto the input
+            result = await self.db.execute(
+                insert(Home).returning(Home.id, sort_by_parameter_order=True),
+                rows
+            )
+            ids = list(result.scalars())
+            await self.db.commit()
+
+            logger.info(f"Bulk inserted {len(ids)} homes")
+            return ids
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error bulk inserting {len(homes)} homes: {str(e)}", exc_info=True)
+            raise
+
@@ -1,18 +1,42 @@
 import re
+import time
 import httpx
 import json
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, List, Optional
 import logging
 
 from app.shared.shared_config import settings
 from app.models.home_model import Home
-from app.schemas.advice_schema import SSEMessage, MessageType, Recommendation, Priority, Category
+from app.schemas.advice_schema import (
+    SSEMessage, MessageType, Recommendation, Priority, Category, GenerationProgress, QueueStatus
+)
 from app.interfaces.llm_service_interface import LLMServiceInterface
+from app.services.advice_cache import AdviceCache, make_advice_cache_key
+from app.services.single_flight import SingleFlight
+from app.services.admission_controller import AdmissionController, AdmissionTicket
+from app.utils.exception_helper import ServiceOverloadedException
+from app.utils.json_stream import JSONArrayStreamParser
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
 class LLMService(LLMServiceInterface):
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        cache: Optional[AdviceCache] = None,
+        flights: Optional[SingleFlight] = None,
+        admission: Optional[AdmissionController] = None,
+        on_complete: Optional[Callable[[str, str, List[Recommendation]], Awaitable[None]]] = None
+    ):
+        # Shared pooled client owned by the app lifespan, never closed here
+        self.client = client
+        self.cache = cache
+        self.flights = flights
+        self.admission = admission
+        # Called with (home_id, prompt_hash, recommendations) when a stream completes
+        self.on_complete = on_complete
     
     def create_energy_prompt(self, home: Home) -> str:
         home_age = 2025 - home.year_built
@@ -129,117 +153,279 @@ Rules:
         # Default to habits if can't categorize
         return "habits"
     
+    def _build_recommendation(self, rec: dict, idx: int) -> Recommendation:
+        # Extract or generate title from details
+        title = rec.get("title") or self._extract_title_from_details(
+            rec.get("details", "Energy Recommendation")
+        )
+        
+        # Auto-categorize if not provided
+        category = rec.get("category")
+        if not category:
+            category = self._categorize_recommendation(rec)
+        
+        # Map field names (LLM uses 'details', we use 'description')
+        description = rec.get("details") or rec.get("description", "")
+        estimated_cost = rec.get("estimate_cost") or rec.get("estimated_cost", "N/A")
+        estimated_savings = rec.get("saving_cost") or rec.get("estimated_savings", "N/A")
+        
+        # Normalize priority
+        priority = rec.get("priority", "medium").lower()
+        if priority not in ["high", "medium", "low"]:
+            priority = "medium"
+        
+        return Recommendation(
+            id=rec.get("id", f"R{idx}"),
+            title=title,
+            description=description,
+            estimated_cost=estimated_cost,
+            estimated_savings=estimated_savings,
+            priority=Priority(priority),
+            category=Category(category.lower())
+        )
+
+    def _generation_options(self) -> dict:
+        """Ollama sampling options; deterministic mode makes cached answers reproducible"""
+        if settings.OLLAMA_DETERMINISTIC:
+            return {
+                "temperature": 0.0,
+                "seed": settings.OLLAMA_SEED,
+            }
+        return {
+            "temperature": settings.OLLAMA_TEMPERATURE,
+            "top_p": settings.OLLAMA_TOP_P,
+        }
+
+    @staticmethod
+    def _progress_message(tokens: int, elapsed: float) -> SSEMessage:
+        return SSEMessage(
+            type=MessageType.PROGRESS,
+            progress=GenerationProgress(
+                tokens=tokens,
+                tokens_per_second=round(tokens / elapsed, 2) if elapsed > 0 else 0.0,
+                elapsed_ms=int(elapsed * 1000),
+            )
+        )
+
+    @staticmethod
+    def _format_sse(msg: SSEMessage) -> str:
+        return f"data: {msg.model_dump_json()}\n\n"
+    
+    def open_recommendations_stream(self, home: Home) -> AsyncIterator[str]:
+        """Decide how advice for ``home`` is served and return its SSE stream.
+
+        Runs before the response starts so it can raise ServiceOverloadedException
+        when a new generation is needed but the generation queue is full.
+        """
+        prompt = self.create_energy_prompt(home)
+        options = self._generation_options()
+        cache_key = make_advice_cache_key(prompt, settings.OLLAMA_MODEL, options)
+
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Advice cache hit for home {home.id}")
+                return self._sse_stream(home, self._replay(cached), cache_key)
+
+        # Attach to an identical in-flight generation
+        if self.flights is not None:
+            flight = self.flights.join(cache_key)
+            if flight is not None:
+                return self._sse_stream(home, flight.subscribe(), cache_key)
+
+        ticket = self.admission.reserve() if self.admission is not None else None
+        generation = self._admitted(ticket, self._generate_and_cache(cache_key, prompt, options))
+
+        if self.flights is None:
+            return self._sse_stream(home, generation, cache_key)
+
+        flight = self.flights.start(cache_key, lambda: generation)
+        return self._sse_stream(home, flight.subscribe(), cache_key)
+
     async def generate_recommendations_stream(
         self,
         home: Home
     ) -> AsyncGenerator[str, None]:
         """Generate recommendations using Ollama with streaming"""
-        prompt = self.create_energy_prompt(home)
-        accumulated_text = ""
-        
         try:
-            async with httpx.AsyncClient(
-                timeout=settings.OLLAMA_TIMEOUT
-            ) as client:
-                # Send connected message
-                msg = SSEMessage(
-                    type=MessageType.CONNECTED,
-                    home_id= str(home.id)
+            stream = self.open_recommendations_stream(home)
+        except ServiceOverloadedException as e:
+            stream = self._sse_stream(home, self._replay([
+                SSEMessage(type=MessageType.ERROR, error=str(e))
+            ]))
+
+        async for chunk in stream:
+            yield chunk
+
+    async def _sse_stream(
+        self,
+        home: Home,
+        messages: AsyncIterator[SSEMessage],
+        prompt_hash: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        # Send connected message
+        msg = SSEMessage(
+            type=MessageType.CONNECTED,
+            home_id= str(home.id)
+        )
+        yield self._format_sse(msg)
+
+        recommendations = []
+        async for msg in messages:
+            if msg.type == MessageType.RECOMMENDATION:
+                recommendations.append(msg.recommendation)
+            elif msg.type == MessageType.COMPLETE and recommendations:
+                # Store before completing so the advice is readable once the client is done
+                await self._record_advice(home, prompt_hash, recommendations)
+            yield self._format_sse(msg)
+
+    async def _record_advice(
+        self,
+        home: Home,
+        prompt_hash: Optional[str],
+        recommendations: List[Recommendation]
+    ) -> None:
+        if self.on_complete is None or prompt_hash is None:
+            return
+        try:
+            await self.on_complete(str(home.id), prompt_hash, recommendations)
+        except Exception as e:
+            logger.error(f"Failed to store advice for home {home.id}: {str(e)}", exc_info=True)
+
+    @staticmethod
+    async def _replay(messages: Iterable[SSEMessage]) -> AsyncGenerator[SSEMessage, None]:
+        for msg in messages:
+            yield msg
+
+    async def _admitted(
+        self,
+        ticket: Optional[AdmissionTicket],
+        messages: AsyncIterator[SSEMessage]
+    ) -> AsyncGenerator[SSEMessage, None]:
+        """Hold ``messages`` back until the ticket gets a slot, reporting queue position"""
+        if ticket is None:
+            async for msg in messages:
+                yield msg
+            return
+
+        try:
+            async for position in ticket.wait(settings.ADVICE_QUEUE_UPDATE_INTERVAL_SECONDS):
+                yield SSEMessage(
+                    type=MessageType.QUEUED,
+                    queue=QueueStatus(
+                        position=position,
+                        estimated_wait_seconds=self.admission.estimated_wait(position)
+                    )
                 )
-                yield f"data: {msg.model_dump_json()}\n\n"
+
+            async for msg in messages:
+                yield msg
+        finally:
+            ticket.release()
+
+    async def _generate_and_cache(
+        self,
+        cache_key: str,
+        prompt: str,
+        options: dict
+    ) -> AsyncGenerator[SSEMessage, None]:
+        generated = []
+        async for msg in self._generate_messages(prompt, options):
+            # Progress is specific to a live generation and never replayed
+            if msg.type != MessageType.PROGRESS:
+                generated.append(msg)
+            yield msg
+
+        # Only cache complete answers that produced at least one recommendation
+        if (
+            self.cache is not None
+            and generated
+            and generated[-1].type == MessageType.COMPLETE
+            and any(msg.type == MessageType.RECOMMENDATION for msg in generated)
+        ):
+            self.cache.put(cache_key, generated)
+
+    async def _generate_messages(
+        self,
+        prompt: str,
+        options: dict
+    ) -> AsyncGenerator[SSEMessage, None]:
+        """Stream one Ollama generation as recommendation/complete/error messages"""
+        try:
+            # Stream from Ollama
+            async with self.client.stream(
+                "POST",
+                f"{settings.OLLAMA_BASE_URL}/api/generate",
+                json={
+                    "model": settings.OLLAMA_MODEL,
+                    "prompt": prompt,
+                    "stream": True,
+                    "options": options,
+                    "format": "json"  # Request JSON format
+                }
+            ) as response:
+                if response.status_code != 200:
+                    error_text = await response.aread()
+                    yield SSEMessage(
+                        type=MessageType.ERROR,
+                        error=f"Ollama error: {error_text.decode()}"
+                    )
+                    return
                 
-                # Stream from Ollama
-                async with client.stream(
-                    "POST",
-                    f"{settings.OLLAMA_BASE_URL}/api/generate",
-                    json={
-                        "model": settings.OLLAMA_MODEL,
-                        "prompt": prompt,
-                        "stream": True,
-                        "options": {
-                            "temperature": 0.7,
-                            "top_p": 0.9,
-                        },
-                        "format": "json"  # Request JSON format
-                    }
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        msg = SSEMessage(
-                            type=MessageType.ERROR,
-                            error=f"Ollama error: {error_text.decode()}"
-                        )
-                        yield f"data: {msg.model_dump_json()}\n\n"
-                        return
-                    
-                    # Accumulate the complete response
-                    async for line in response.aiter_lines():
-                        if line.strip():
-                            try:
-                                data = json.loads(line)
-                                if "response" in data:
-                                    accumulated_text += data["response"]
-                                
-                                if data.get("done", False):
-                                    # Parse complete JSON response
-                                    recommendations = self._parse_recommendations(accumulated_text)
-                                    
-                                    # Stream each recommendation separately
-                                    for idx, rec in enumerate(recommendations, 1):
-                                        # Extract or generate title from details
-                                        title = rec.get("title") or self._extract_title_from_details(
-                                            rec.get("details", "Energy Recommendation")
-                                        )
-                                        
-                                        # Auto-categorize if not provided
-                                        category = rec.get("category")
-                                        if not category:
-                                            category = self._categorize_recommendation(rec)
-                                        
-                                        # Map field names (LLM uses 'details', we use 'description')
-                                        description = rec.get("details") or rec.get("description", "")
-                                        estimated_cost = rec.get("estimate_cost") or rec.get("estimated_cost", "N/A")
-                                        estimated_savings = rec.get("saving_cost") or rec.get("estimated_savings", "N/A")
-                                        
-                                        # Normalize priority
-                                        priority = rec.get("priority", "medium").lower()
-                                        if priority not in ["high", "medium", "low"]:
-                                            priority = "medium"
-                                        
-                                        # Create recommendation object
-                                        recommendation = Recommendation(
-                                            id=rec.get("id", f"R{idx}"),
-                                            title=title,
-                                            description=description,
-                                            estimated_cost=estimated_cost,
-                                            estimated_savings=estimated_savings,
-                                            priority=Priority(priority),
-                                            category=Category(category.lower())
-                                        )
-                                        
-                                        msg = SSEMessage(
-                                            type=MessageType.RECOMMENDATION,
-                                            recommendation=recommendation
-                                        )
-                                        yield f"data: {msg.model_dump_json()}\n\n"
-                                    
-                                    # Send complete message
-                                    msg = SSEMessage(type=MessageType.COMPLETE)
-                                    yield f"data: {msg.model_dump_json()}\n\n"
-                                    break
-                                    
-                            except json.JSONDecodeError:
-                                continue
-                                
+                parser = JSONArrayStreamParser(key="recommendations")
+                text_parts = []
+                emitted = 0
+                tokens = 0
+                started = time.monotonic()
+                last_progress = started
+
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        try:
+                            data = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+
+                        chunk = data.get("response", "")
+                        if chunk:
+                            tokens += 1
+                            text_parts.append(chunk)
+
+                            # Emit each recommendation as soon as its object closes
+                            for rec in parser.feed(chunk):
+                                emitted += 1
+                                yield SSEMessage(
+                                    type=MessageType.RECOMMENDATION,
+                                    recommendation=self._build_recommendation(rec, emitted)
+                                )
+
+                            if settings.ADVICE_PROGRESS_EVENTS:
+                                now = time.monotonic()
+                                if now - last_progress >= settings.ADVICE_PROGRESS_INTERVAL_SECONDS:
+                                    last_progress = now
+                                    yield self._progress_message(tokens, now - started)
+
+                        if data.get("done", False):
+                            if emitted == 0:
+                                # Output did not match the expected structure while streaming,
+                                # fall back to parsing the complete response
+                                recommendations = self._parse_recommendations("".join(text_parts))
+                                for idx, rec in enumerate(recommendations, 1):
+                                    yield SSEMessage(
+                                        type=MessageType.RECOMMENDATION,
+                                        recommendation=self._build_recommendation(rec, idx)
+                                    )
+                            
+                            # Send complete message
+                            yield SSEMessage(type=MessageType.COMPLETE)
+                            break
+                            
         except httpx.ConnectError:
             error_msg = "Cannot connect to Ollama. Ensure Ollama is running."
-            msg = SSEMessage(type=MessageType.ERROR, error=error_msg)
-            yield f"data: {msg.model_dump_json()}\n\n"
+            yield SSEMessage(type=MessageType.ERROR, error=error_msg)
         except httpx.TimeoutException:
             error_msg = "Request to Ollama timed out. Please try again."
-            msg = SSEMessage(type=MessageType.ERROR, error=error_msg)
-            yield f"data: {msg.model_dump_json()}\n\n"
+            yield SSEMessage(type=MessageType.ERROR, error=error_msg)
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            msg = SSEMessage(type=MessageType.ERROR, error=error_msg)
-            yield f"data: {msg.model_dump_json()}\n\n"
+            yield SSEMessage(type=MessageType.ERROR, error=error_msg)
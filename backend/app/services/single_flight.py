@@ -0,0 +1,115 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional
+import logging
+
+from app.schemas.advice_schema import SSEMessage, MessageType
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+
+class Flight:
+    """One in-flight generation whose messages are fanned out to every subscriber"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.messages: List[SSEMessage] = []
+        self.done = False
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, msg: SSEMessage) -> None:
+        async with self._changed:
+            self.messages.append(msg)
+            self._changed.notify_all()
+
+    async def finish(self) -> None:
+        async with self._changed:
+            self.done = True
+            self._changed.notify_all()
+
+    async def subscribe(self, start: int = 0) -> AsyncGenerator[SSEMessage, None]:
+        """Replay messages from ``start`` then follow the live generation"""
+        self.subscribers += 1
+        idx = start
+        try:
+            while True:
+                while idx < len(self.messages):
+                    yield self.messages[idx]
+                    idx += 1
+                if self.done:
+                    return
+                async with self._changed:
+                    await self._changed.wait_for(
+                        lambda: self.done or len(self.messages) > idx
+                    )
+        finally:
+            self.subscribers -= 1
+
+
+class SingleFlight:
+    """Registry coalescing concurrent generations of the same prompt into one.
+
+    The generation runs in its own task so it is not tied to the request that
+    started it: the first client disconnecting does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, Flight] = {}
+        self.started = 0
+        self.joined = 0
+
+    def join(self, key: str) -> Optional[Flight]:
+        """Attach to the running generation for ``key``, if any"""
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.joined += 1
+            logger.info(f"Joining in-flight generation {key[:12]}")
+        return flight
+
+    def start(
+        self,
+        key: str,
+        factory: Callable[[], AsyncIterator[SSEMessage]]
+    ) -> Flight:
+        """Run ``factory()`` in a background task as the flight for ``key``"""
+        flight = Flight(key)
+        self._flights[key] = flight
+        self.started += 1
+        flight.task = asyncio.create_task(self._run(flight, factory))
+        return flight
+
+    async def _run(
+        self,
+        flight: Flight,
+        factory: Callable[[], AsyncIterator[SSEMessage]]
+    ) -> None:
+        try:
+            async for msg in factory():
+                await flight.publish(msg)
+        except asyncio.CancelledError:
+            await flight.publish(SSEMessage(type=MessageType.ERROR, error="Generation cancelled"))
+            raise
+        except Exception as e:
+            logger.error(f"Generation {flight.key[:12]} failed: {str(e)}", exc_info=True)
+            await flight.publish(SSEMessage(type=MessageType.ERROR, error=f"Unexpected error: {str(e)}"))
+        finally:
+            await flight.finish()
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+
+    async def shutdown(self) -> None:
+        """Cancel all running generations (app shutdown)"""
+        tasks = [flight.task for flight in self._flights.values() if flight.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._flights),
+            "subscribers": sum(flight.subscribers for flight in self._flights.values()),
+            "started": self.started,
+            "joined": self.joined,
+        }
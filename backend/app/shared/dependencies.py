@@ -1,13 +1,22 @@
 
-from fastapi import Depends
-from typing import AsyncGenerator
+import httpx
+from fastapi import Depends, Request
+from functools import lru_cache
+from typing import AsyncGenerator, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.database import AsyncSessionLocal
 from app.services.home_service import HomeService
 from app.services.llm_service import LLMService
+from app.services.advice_service import AdviceService
+from app.services.advice_cache import AdviceCache
+from app.services.single_flight import SingleFlight
+from app.services.admission_controller import AdmissionController
+from app.shared.shared_config import settings
 from app.interfaces.home_service_interface import HomeServiceInterface
 from app.interfaces.llm_service_interface import LLMServiceInterface
+from app.interfaces.advice_service_interface import AdviceServiceInterface
+from app.schemas.advice_schema import Recommendation
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -28,8 +37,67 @@ async def get_home_service(
     return HomeService(db)
 
 
-def get_llm_service() -> LLMServiceInterface:
-    return LLMService()
+async def get_advice_service(
+    db: AsyncSession = Depends(get_db)
+) -> AdviceServiceInterface:
+    return AdviceService(db)
+
+
+async def record_advice(
+    home_id: str,
+    prompt_hash: str,
+    recommendations: List[Recommendation]
+) -> None:
+    """Persist generated advice in its own session (the stream outlives the request)"""
+    async with AsyncSessionLocal() as session:
+        await AdviceService(session).save_advice(
+            home_id, settings.OLLAMA_MODEL, prompt_hash, recommendations
+        )
+        await session.commit()
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Shared pooled Ollama client created in the app lifespan"""
+    return request.app.state.http_client
+
+
+@lru_cache
+def get_advice_cache() -> AdviceCache:
+    """Process-wide advice cache shared by all requests"""
+    return AdviceCache(
+        max_entries=settings.ADVICE_CACHE_MAX_ENTRIES,
+        max_bytes=settings.ADVICE_CACHE_MAX_BYTES,
+        ttl_seconds=settings.ADVICE_CACHE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def get_single_flight() -> SingleFlight:
+    """Process-wide registry of in-flight advice generations"""
+    return SingleFlight()
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController:
+    """Process-wide limit on concurrent Ollama generations"""
+    return AdmissionController(
+        max_in_flight=settings.OLLAMA_MAX_IN_FLIGHT,
+        max_queue=settings.OLLAMA_MAX_QUEUE,
+    )
+
+
+def get_llm_service(
+    client: httpx.AsyncClient = Depends(get_http_client)
+) -> LLMServiceInterface:
+    cache: Optional[AdviceCache] = get_advice_cache() if settings.ADVICE_CACHE_ENABLED else None
+    flights: Optional[SingleFlight] = get_single_flight() if settings.ADVICE_SINGLE_FLIGHT_ENABLED else None
+    return LLMService(
+        client,
+        cache=cache,
+        flights=flights,
+        admission=get_admission_controller(),
+        on_complete=record_advice
+    )
 
 
 # Import Depends from FastAPI
@@ -0,0 +1,54 @@
+import logging
+import httpx
+
+from app.shared.shared_config import settings
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the shared, pooled HTTP client used for all Ollama traffic"""
+    http2 = settings.OLLAMA_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("OLLAMA_HTTP2 is enabled but 'h2' is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.OLLAMA_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OLLAMA_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.OLLAMA_POOL_KEEPALIVE_EXPIRY,
+    )
+
+    return httpx.AsyncClient(
+        timeout=settings.OLLAMA_TIMEOUT,
+        limits=limits,
+        http2=http2,
+    )
+
+
+def get_pool_stats(client: httpx.AsyncClient) -> dict:
+    """Snapshot of the client's connection pool for monitoring"""
+    pool = getattr(client._transport, "_pool", None)
+    if pool is None:
+        return {}
+
+    connections = list(pool.connections)
+    return {
+        "max_connections": pool._max_connections,
+        "max_keepalive_connections": pool._max_keepalive_connections,
+        "connections": len(connections),
+        "idle": sum(1 for conn in connections if conn.is_idle()),
+        "active": sum(1 for conn in connections if not conn.is_idle() and not conn.is_closed()),
+        "http2": sum(1 for conn in connections if "HTTP/2" in conn.info()),
+        "requests": len(pool._requests),
+        "queued_requests": sum(1 for request in pool._requests if request.is_queued()),
+    }
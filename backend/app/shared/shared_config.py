@@ -14,7 +14,40 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str
     OLLAMA_MODEL: str
     OLLAMA_TIMEOUT: int 
+
+    # Ollama HTTP connection pool (shared client created in the app lifespan)
+    OLLAMA_POOL_MAX_CONNECTIONS: int = 100
+    OLLAMA_POOL_MAX_KEEPALIVE: int = 20
+    OLLAMA_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    OLLAMA_HTTP2: bool = False
+
+    # Generation options (deterministic mode makes cached advice reproducible)
+    OLLAMA_DETERMINISTIC: bool = True
+    OLLAMA_SEED: int = 42
+    OLLAMA_TEMPERATURE: float = 0.7
+    OLLAMA_TOP_P: float = 0.9
+
+    # Optional progress events (tokens so far, tokens/s) while generating
+    ADVICE_PROGRESS_EVENTS: bool = False
+    ADVICE_PROGRESS_INTERVAL_SECONDS: float = 1.0
+
+    # Advice cache (keyed by prompt + model + generation options)
+    ADVICE_CACHE_ENABLED: bool = True
+    ADVICE_CACHE_MAX_ENTRIES: int = 1024
+    ADVICE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    ADVICE_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+
+    # Coalesce concurrent generations of the same prompt into one
+    ADVICE_SINGLE_FLIGHT_ENABLED: bool = True
+
+    # Admission control in front of Ollama (excess requests wait in a FIFO queue)
+    OLLAMA_MAX_IN_FLIGHT: int = 4
+    OLLAMA_MAX_QUEUE: int = 64
+    ADVICE_QUEUE_UPDATE_INTERVAL_SECONDS: float = 1.0
     
+    # Bulk home ingestion (rows per multi-row INSERT / transaction)
+    BULK_INSERT_BATCH_SIZE: int = 1000
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
 
@@ -11,4 +11,12 @@ class ValidationException(Exception):
 
 class ExternalServiceException(Exception):
     """Exception raised when an external service fails"""
-    pass
\ No newline at end of file
+    pass
+
+
+class ServiceOverloadedException(Exception):
+    """Exception raised when a request cannot be queued because capacity is exhausted"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
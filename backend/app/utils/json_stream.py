@@ -0,0 +1,170 @@
+import codecs
+import json
+import re
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Union
+
+# Characters that change the parser state outside / inside a JSON string
+_STRUCTURAL = re.compile(r'["{}\[\]:,]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JSONArrayStreamParser:
+    """Incrementally extracts complete objects from a JSON array as text arrives.
+
+    With ``key`` set, the array is the value of that key in the top-level
+    object (e.g. ``{"recommendations": [{...}, {...}]}``); with ``key=None``
+    the document itself is the array. Text outside the JSON document (such as
+    markdown code fences) is ignored. Only the object currently being read is
+    kept in memory.
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        self.key = key
+        self.array_closed = False
+
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._array_depth: Optional[int] = None
+        self._object_start: Optional[int] = None
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._expect_array = False
+
+    def feed(self, text: str) -> List[dict]:
+        """Consume the next chunk and return the objects it completed"""
+        if self.array_closed or not text:
+            return []
+
+        self._buf += text
+        completed: List[dict] = []
+        buf = self._buf
+        pos = self._pos
+
+        while pos < len(buf):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if self._depth == 1 and self._array_depth is None:
+                    self._last_string = buf[self._string_start:pos - 1]
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            char = match.group()
+            pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+                self._expect_array = False
+            elif char == ":":
+                self._expect_array = self.key is not None and self._last_string == self.key
+            elif char == ",":
+                self._expect_array = False
+            elif char == "{":
+                if self._array_depth is not None and self._depth == self._array_depth:
+                    self._object_start = pos - 1
+                self._depth += 1
+                self._expect_array = False
+            elif char == "[":
+                if self._array_depth is None and (
+                    (self.key is None and self._depth == 0)
+                    or (self._expect_array and self._depth == 1)
+                ):
+                    self._array_depth = self._depth + 1
+                self._depth += 1
+                self._expect_array = False
+            elif char == "}":
+                self._depth -= 1
+                if (
+                    self._object_start is not None
+                    and self._depth == self._array_depth
+                ):
+                    obj = self._load(buf[self._object_start:pos])
+                    if obj is not None:
+                        completed.append(obj)
+                    self._object_start = None
+            elif char == "]":
+                self._depth -= 1
+                if self._array_depth is not None and self._depth == self._array_depth - 1:
+                    self.array_closed = True
+                    break
+
+        # Drop text that is no longer needed to rebuild the object in progress
+        if self._object_start is not None:
+            keep_from = self._object_start
+            self._object_start = 0
+        else:
+            keep_from = pos
+        if self._in_string and self._array_depth is None:
+            keep_from = min(keep_from, self._string_start)
+            self._string_start -= keep_from
+        self._buf = buf[keep_from:]
+        self._pos = pos - keep_from
+        return completed
+
+    @staticmethod
+    def _load(text: str) -> Optional[dict]:
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return obj if isinstance(obj, dict) else None
+
+
+async def iter_json_records(
+    chunks: AsyncIterator[bytes],
+    ndjson: bool = False
+) -> AsyncGenerator[Union[dict, ValueError], None]:
+    """Yield the objects of a streamed JSON array (or NDJSON body) one at a time.
+
+    Malformed NDJSON lines are yielded as ``ValueError`` so callers can report
+    them per row without aborting the whole stream.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    if not ndjson:
+        parser = JSONArrayStreamParser()
+        async for chunk in chunks:
+            for obj in parser.feed(decoder.decode(chunk)):
+                yield obj
+        for obj in parser.feed(decoder.decode(b"", final=True)):
+            yield obj
+        return
+
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            if line.strip():
+                yield _load_line(line)
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield _load_line(pending)
+
+
+def _load_line(line: str) -> Union[dict, ValueError]:
+    try:
+        obj = json.loads(line)
+    except json.JSONDecodeError as e:
+        return ValueError(f"Invalid JSON: {e.msg}")
+    if not isinstance(obj, dict):
+        return ValueError("Each line must be a JSON object")
+    return obj
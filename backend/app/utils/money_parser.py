@@ -0,0 +1,24 @@
+import re
+from typing import Optional, Tuple
+
+# "12,000" / "12.000" (grouped thousands), "1500", "1.5" / "1,5" (decimals), optional "k"
+_AMOUNT = re.compile(r"(\d{1,3}(?:[.,\s]\d{3})+|\d+(?:[.,]\d{1,2})?)\s*(k)?", re.IGNORECASE)
+
+
+def _to_number(digits: str, thousands: Optional[str]) -> float:
+    if re.fullmatch(r"\d{1,3}(?:[.,\s]\d{3})+", digits):
+        value = float(re.sub(r"[.,\s]", "", digits))
+    else:
+        value = float(digits.replace(",", "."))
+    return value * 1000 if thousands else value
+
+
+def parse_money_range(text: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+    """Parse LLM cost/savings strings like "9,000 - 12,000 €" or "600 €/year" into (min, max)"""
+    if not text:
+        return None, None
+
+    amounts = [_to_number(digits, k) for digits, k in _AMOUNT.findall(text)]
+    if not amounts:
+        return None, None
+    return min(amounts[:2]), max(amounts[:2])
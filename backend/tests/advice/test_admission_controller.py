@@ -0,0 +1,112 @@
+
+import asyncio
+import json
+import pytest
+import httpx
+
+from app.main import app
+from app.models.home_model import Home
+from app.services.llm_service import LLMService
+from app.services.admission_controller import AdmissionController
+from app.shared.dependencies import get_home_service, get_llm_service
+from app.utils.exception_helper import ServiceOverloadedException
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_fifo_queue_and_rejection(self):
+        # Arrange
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+
+        # Act
+        running = controller.reserve()
+        queued = controller.reserve()
+        with pytest.raises(ServiceOverloadedException) as exc_info:
+            controller.reserve()
+        position_before = queued.position()
+        running.release()
+
+        # Assert
+        assert running.admitted
+        assert position_before == 1
+        assert queued.admitted
+        assert exc_info.value.retry_after >= 1
+        stats = controller.stats()
+        assert stats["in_flight"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["rejected"] == 1
+        assert stats["admitted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_abandoned_ticket_leaves_queue(self):
+        # Arrange
+        controller = AdmissionController(max_in_flight=1, max_queue=2)
+        running = controller.reserve()
+        queued = controller.reserve()
+
+        # Act
+        queued.release()
+
+        # Assert
+        assert controller.stats()["queue_depth"] == 0
+        assert not queued.admitted
+        running.release()
+        assert controller.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_reports_queue_position(
+        self, ollama_client: httpx.AsyncClient, sample_home: Home
+    ):
+        # Arrange
+        controller = AdmissionController(max_in_flight=1, max_queue=4)
+        service = LLMService(ollama_client, admission=controller)
+        blocker = controller.reserve()
+
+        async def collect():
+            return [
+                json.loads(chunk[len("data: "):])
+                async for chunk in service.generate_recommendations_stream(sample_home)
+            ]
+
+        # Act
+        task = asyncio.create_task(collect())
+        await asyncio.sleep(0.05)
+        blocker.release()
+        events = await task
+
+        # Assert
+        assert [event["type"] for event in events[:2]] == ["connected", "queued"]
+        assert events[1]["queue"]["position"] == 1
+        assert events[-1]["type"] == "complete"
+        assert controller.stats()["in_flight"] == 0
+
+
+class TestAdviceRouteOverload:
+    @pytest.mark.asyncio
+    async def test_full_queue_returns_503_with_retry_after(
+        self, ollama_client: httpx.AsyncClient, sample_home: Home
+    ):
+        # Arrange
+        controller = AdmissionController(max_in_flight=1, max_queue=0)
+        blocker = controller.reserve()
+
+        class StubHomeService:
+            async def get_home(self, home_id):
+                return sample_home
+
+        app.dependency_overrides[get_home_service] = lambda: StubHomeService()
+        app.dependency_overrides[get_llm_service] = lambda: LLMService(ollama_client, admission=controller)
+
+        # Act
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(f"/api/v1/homes/{sample_home.id}/advice")
+        finally:
+            app.dependency_overrides.clear()
+            blocker.release()
+
+        # Assert
+        assert response.status_code == 503
+        assert int(response.headers["Retry-After"]) >= 1
@@ -0,0 +1,97 @@
+
+import pytest
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.home_model import Home
+from app.services.home_service import HomeService
+from app.services.advice_service import AdviceService
+from app.services.llm_service import LLMService
+from app.schemas.home_schema import HomeCreate
+from app.schemas.advice_schema import Recommendation
+
+
+def make_recommendation(idx: int, cost: str, savings: str) -> Recommendation:
+    return Recommendation(
+        id=f"R{idx}",
+        title="Insulate the attic",
+        description="Insulate the attic floor with 24 cm mineral wool.",
+        estimated_cost=cost,
+        estimated_savings=savings,
+        priority="high",
+        category="insulation",
+    )
+
+
+async def create_home(db_session: AsyncSession) -> Home:
+    return await HomeService(db_session).create_home(HomeCreate(
+        size_sqft=1500,
+        year_built=1990,
+        heating_type="gas",
+        insulation_level="moderate",
+        windows_type="double",
+        roof_type="pitched",
+        num_occupants=3,
+        monthly_energy_bill=150.50,
+        location="Berlin, Germany"
+    ))
+
+
+class TestAdviceService:
+    @pytest.mark.asyncio
+    async def test_save_and_get_latest_advice(self, db_session: AsyncSession):
+        # Arrange
+        home = await create_home(db_session)
+        service = AdviceService(db_session)
+        await service.save_advice(str(home.id), "llama2:7b", "a" * 64, [
+            make_recommendation(1, "1,000 €", "300 €/year"),
+        ])
+
+        # Act
+        await service.save_advice(str(home.id), "llama2:7b", "b" * 64, [
+            make_recommendation(1, "9,000 - 12,000 €", "600 - 900 €/year"),
+            make_recommendation(2, "2,000 - 3,500 €", "N/A"),
+        ])
+        latest = await service.get_latest_advice(str(home.id))
+
+        # Assert
+        assert latest is not None
+        assert latest.prompt_hash == "b" * 64
+        assert len(latest.recommendations) == 2
+        assert latest.total_cost_min == 11000
+        assert latest.total_cost_max == 15500
+        assert latest.total_savings_min == 600
+        assert latest.total_savings_max == 900
+        assert latest.recommendations[0]["cost_max"] == 12000
+
+    @pytest.mark.asyncio
+    async def test_get_latest_advice_not_found(self, db_session: AsyncSession):
+        # Arrange
+        service = AdviceService(db_session)
+
+        # Act
+        advice = await service.get_latest_advice(str(uuid4()))
+
+        # Assert
+        assert advice is None
+
+    @pytest.mark.asyncio
+    async def test_stream_records_advice_on_complete(self, ollama_client, sample_home: Home):
+        # Arrange
+        recorded = []
+
+        async def on_complete(home_id, prompt_hash, recommendations):
+            recorded.append((home_id, prompt_hash, recommendations))
+
+        service = LLMService(ollama_client, on_complete=on_complete)
+
+        # Act
+        chunks = [chunk async for chunk in service.generate_recommendations_stream(sample_home)]
+
+        # Assert
+        assert '"type":"complete"' in chunks[-1]
+        assert len(recorded) == 1
+        home_id, prompt_hash, recommendations = recorded[0]
+        assert home_id == str(sample_home.id)
+        assert len(prompt_hash) == 64
+        assert [rec.id for rec in recommendations] == ["R1", "R2"]
@@ -0,0 +1,146 @@
+
+import json
+import pytest
+import httpx
+
+from app.models.home_model import Home
+from app.services.llm_service import LLMService
+from app.services.advice_cache import AdviceCache, make_advice_cache_key
+from app.shared.http_client import create_http_client, get_pool_stats
+from tests.conftest import SAMPLE_LLM_OUTPUT, ollama_ndjson
+
+
+def parse_events(chunks: list[str]) -> list[dict]:
+    return [json.loads(chunk[len("data: "):]) for chunk in chunks if chunk.startswith("data: ")]
+
+
+class TestLLMService:
+    @pytest.mark.asyncio
+    async def test_stream_uses_injected_client(
+        self, ollama_client: httpx.AsyncClient, ollama_requests: list, sample_home: Home
+    ):
+        # Arrange
+        service = LLMService(ollama_client)
+
+        # Act
+        chunks = [chunk async for chunk in service.generate_recommendations_stream(sample_home)]
+        events = parse_events(chunks)
+
+        # Assert
+        assert len(ollama_requests) == 1
+        assert ollama_requests[0].url.path == "/api/generate"
+        assert [event["type"] for event in events] == [
+            "connected", "recommendation", "recommendation", "complete"
+        ]
+        assert events[0]["home_id"] == str(sample_home.id)
+        assert events[1]["recommendation"]["category"] == "heating"
+        assert not ollama_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_stream_reports_connect_error(self, sample_home: Home):
+        # Arrange
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = LLMService(client)
+
+            # Act
+            events = parse_events(
+                [chunk async for chunk in service.generate_recommendations_stream(sample_home)]
+            )
+
+        # Assert
+        assert events[-1]["type"] == "error"
+        assert "Cannot connect to Ollama" in events[-1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_recommendation_emitted_before_generation_finishes(self, sample_home: Home):
+        # Arrange
+        lines = ollama_ndjson(SAMPLE_LLM_OUTPUT).splitlines(keepends=True)
+        sent = []
+
+        async def body():
+            for line in lines:
+                sent.append(line)
+                yield line
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = LLMService(client)
+
+            # Act
+            sent_at_first_recommendation = None
+            async for chunk in service.generate_recommendations_stream(sample_home):
+                if '"type":"recommendation"' in chunk and sent_at_first_recommendation is None:
+                    sent_at_first_recommendation = len(sent)
+
+        # Assert
+        assert sent_at_first_recommendation is not None
+        # Ollama chunks are 8 characters, R1 closes before R2's id is streamed
+        assert sent_at_first_recommendation <= SAMPLE_LLM_OUTPUT.index('"R2"') // 8 + 1
+
+    @pytest.mark.asyncio
+    async def test_shared_client_pool_stats(self):
+        # Arrange
+        client = create_http_client()
+
+        # Act
+        stats = get_pool_stats(client)
+        await client.aclose()
+
+        # Assert
+        assert stats["connections"] == 0
+        assert stats["max_connections"] > 0
+        assert stats["queued_requests"] == 0
+
+
+class TestAdviceCache:
+    @pytest.mark.asyncio
+    async def test_cache_hit_replays_without_ollama(
+        self, ollama_client: httpx.AsyncClient, ollama_requests: list, sample_home: Home
+    ):
+        # Arrange
+        cache = AdviceCache(max_entries=10, max_bytes=1024 * 1024, ttl_seconds=60)
+        service = LLMService(ollama_client, cache=cache)
+
+        # Act
+        first = parse_events([c async for c in service.generate_recommendations_stream(sample_home)])
+        second = parse_events([c async for c in service.generate_recommendations_stream(sample_home)])
+
+        # Assert
+        assert len(ollama_requests) == 1
+        assert first == second
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, sample_home: Home):
+        # Arrange
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, content=b"model not found")
+
+        cache = AdviceCache(max_entries=10, max_bytes=1024 * 1024, ttl_seconds=60)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = LLMService(client, cache=cache)
+
+            # Act
+            events = parse_events([c async for c in service.generate_recommendations_stream(sample_home)])
+
+        # Assert
+        assert events[-1]["type"] == "error"
+        assert cache.stats()["entries"] == 0
+
+    def test_cache_key_depends_on_model_and_options(self):
+        # Arrange
+        options = {"temperature": 0.0, "seed": 42}
+
+        # Act
+        key = make_advice_cache_key("prompt", "llama2:7b", options)
+
+        # Assert
+        assert key == make_advice_cache_key("prompt", "llama2:7b", dict(reversed(options.items())))
+        assert key != make_advice_cache_key("prompt", "mistral", options)
+        assert key != make_advice_cache_key("prompt", "llama2:7b", {"temperature": 0.7})
@@ -0,0 +1,101 @@
+
+import asyncio
+import json
+import pytest
+import httpx
+
+from app.models.home_model import Home
+from app.services.llm_service import LLMService
+from app.services.single_flight import SingleFlight
+from app.schemas.advice_schema import SSEMessage, MessageType
+from tests.conftest import SAMPLE_LLM_OUTPUT, ollama_ndjson
+
+
+def gated_ollama_client(requests: list, gate: asyncio.Event) -> httpx.AsyncClient:
+    """Ollama mock that holds the final chunks back until ``gate`` is set"""
+    lines = ollama_ndjson(SAMPLE_LLM_OUTPUT).splitlines(keepends=True)
+
+    async def body():
+        for idx, line in enumerate(lines):
+            if idx == len(lines) - 2:
+                await gate.wait()
+            yield line
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=body())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def collect_types(service: LLMService, home: Home) -> list[str]:
+    return [
+        json.loads(chunk[len("data: "):])["type"]
+        async for chunk in service.generate_recommendations_stream(home)
+    ]
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_generation(self, sample_home: Home):
+        # Arrange
+        requests = []
+        gate = asyncio.Event()
+        flights = SingleFlight()
+
+        async with gated_ollama_client(requests, gate) as client:
+            service = LLMService(client, flights=flights)
+
+            # Act
+            first = asyncio.create_task(collect_types(service, sample_home))
+            second = asyncio.create_task(collect_types(service, sample_home))
+            await asyncio.sleep(0.05)
+            gate.set()
+            results = await asyncio.gather(first, second)
+
+        # Assert
+        assert len(requests) == 1
+        assert results[0] == results[1] == ["connected", "recommendation", "recommendation", "complete"]
+        assert flights.stats()["started"] == 1
+        assert flights.stats()["joined"] == 1
+        assert flights.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_late_joiner_receives_earlier_messages(self):
+        # Arrange
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def generate():
+            yield SSEMessage(type=MessageType.PROGRESS)
+            await release.wait()
+            yield SSEMessage(type=MessageType.COMPLETE)
+
+        flight = flights.start("key", generate)
+        await asyncio.sleep(0.01)
+
+        # Act
+        late = flights.join("key")
+        release.set()
+        received = [msg.type async for msg in late.subscribe()]
+
+        # Assert
+        assert late is flight
+        assert received == [MessageType.PROGRESS, MessageType.COMPLETE]
+
+    @pytest.mark.asyncio
+    async def test_generation_error_is_published(self):
+        # Arrange
+        flights = SingleFlight()
+
+        async def generate():
+            raise RuntimeError("boom")
+            yield
+
+        # Act
+        flight = flights.start("key", generate)
+        received = [msg async for msg in flight.subscribe()]
+
+        # Assert
+        assert received[-1].type == MessageType.ERROR
+        assert "boom" in received[-1].error
@@ -1,12 +1,15 @@
 
+import json
 import pytest
 import asyncio
+import httpx
+from uuid import uuid4
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.shared.database import Base
-from app.models.home_model import Home
+from app.models.home_model import Home, HeatingType, InsulationLevel, WindowsType, RoofType
 
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -53,3 +56,67 @@ async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
         yield session
         await session.commit()
         await session.rollback()
+
+
+@pytest.fixture
+def sample_home() -> Home:
+    """Unsaved home profile for service-level tests"""
+    return Home(
+        id=uuid4(),
+        size_sqft=1500,
+        year_built=1990,
+        heating_type=HeatingType.GAS,
+        insulation_level=InsulationLevel.MODERATE,
+        windows_type=WindowsType.DOUBLE,
+        roof_type=RoofType.PITCHED,
+        num_occupants=3,
+        monthly_energy_bill=150.50,
+        location="Berlin, Germany",
+    )
+
+
+SAMPLE_LLM_OUTPUT = json.dumps({
+    "recommendations": [
+        {
+            "id": "R1",
+            "priority": "High",
+            "details": "Replace the gas boiler with an air-source heat pump. Size it for the full load.",
+            "estimate_cost": "9,000 - 12,000 €",
+            "saving_cost": "600 - 900 €/year",
+        },
+        {
+            "id": "R2",
+            "priority": "Medium",
+            "details": "Insulate the attic floor with 24 cm mineral wool.",
+            "estimate_cost": "2,000 - 3,500 €",
+            "saving_cost": "350 - 500 €/year",
+        },
+    ]
+})
+
+
+def ollama_ndjson(text: str, chunk_size: int = 8) -> bytes:
+    """Render text as the NDJSON stream Ollama returns from /api/generate"""
+    lines = [
+        json.dumps({"response": text[i:i + chunk_size], "done": False})
+        for i in range(0, len(text), chunk_size)
+    ]
+    lines.append(json.dumps({"response": "", "done": True}))
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.fixture
+def ollama_requests() -> list:
+    """Requests captured by the mock Ollama transport"""
+    return []
+
+
+@pytest.fixture
+async def ollama_client(ollama_requests) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """HTTP client whose transport imitates Ollama's streaming /api/generate"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        ollama_requests.append(request)
+        return httpx.Response(200, content=ollama_ndjson(SAMPLE_LLM_OUTPUT))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        yield client
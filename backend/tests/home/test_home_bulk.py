@@ -0,0 +1,96 @@
+
+import json
+import pytest
+import httpx
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.models.home_model import Home
+from app.services.home_service import HomeService
+from app.schemas.home_schema import HomeCreate
+from app.shared.dependencies import get_home_service
+
+
+def home_payload(**overrides) -> dict:
+    payload = {
+        "size_sqft": 1500,
+        "year_built": 1990,
+        "heating_type": "gas",
+        "insulation_level": "moderate",
+        "windows_type": "double",
+        "roof_type": "pitched",
+        "num_occupants": 3,
+        "monthly_energy_bill": 150.50,
+        "location": "Berlin, Germany",
+    }
+    payload.update(overrides)
+    return payload
+
+
+async def post_bulk(db_session: AsyncSession, content: bytes, content_type: str) -> list[dict]:
+    app.dependency_overrides[get_home_service] = lambda: HomeService(db_session)
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/api/v1/homes/bulk", content=content, headers={"Content-Type": content_type}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestHomeBulk:
+    @pytest.mark.asyncio
+    async def test_create_homes_bulk_returns_ids_in_order(self, db_session: AsyncSession):
+        # Arrange
+        service = HomeService(db_session)
+        homes = [HomeCreate(**home_payload(size_sqft=1000 + i)) for i in range(5)]
+
+        # Act
+        ids = await service.create_homes_bulk(homes)
+
+        # Assert
+        assert len(ids) == 5
+        for idx, home_id in enumerate(ids):
+            home = await service.get_home(home_id)
+            assert home.size_sqft == 1000 + idx
+
+    @pytest.mark.asyncio
+    async def test_bulk_json_array_reports_per_row_results(self, db_session: AsyncSession):
+        # Arrange
+        rows = [home_payload(), home_payload(size_sqft=-1), home_payload(location="Hamburg")]
+
+        # Act
+        results = await post_bulk(db_session, json.dumps(rows).encode(), "application/json")
+
+        # Assert
+        statuses = sorted((r["index"], r["status"]) for r in results[:-1])
+        assert statuses == [(0, "created"), (1, "error"), (2, "created")]
+        assert results[-1]["summary"]["created"] == 2
+        assert results[-1]["summary"]["failed"] == 1
+        count = await db_session.scalar(select(func.count()).select_from(Home))
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_ndjson_with_invalid_line(self, db_session: AsyncSession):
+        # Arrange
+        body = "\n".join([
+            json.dumps(home_payload()),
+            "{not json",
+            json.dumps(home_payload(heating_type="heat_pump")),
+        ]).encode()
+
+        # Act
+        results = await post_bulk(db_session, body, "application/x-ndjson")
+
+        # Assert
+        by_index = {r["index"]: r for r in results[:-1]}
+        assert by_index[0]["status"] == "created"
+        assert by_index[1]["status"] == "error"
+        assert by_index[2]["status"] == "created"
+        assert results[-1]["summary"]["received"] == 3
@@ -0,0 +1,51 @@
+
+import json
+import pytest
+
+from app.utils.json_stream import JSONArrayStreamParser
+
+
+class TestJSONArrayStreamParser:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_emits_objects_as_they_close(self, chunk_size: int):
+        # Arrange
+        document = "```json\n" + json.dumps({
+            "note": "brackets [inside] {strings} are \"ignored\"",
+            "recommendations": [
+                {"id": "R1", "details": "escaped \\\" quote } brace", "nested": {"a": [1, {"b": 2}]}},
+                {"id": "R2"},
+            ],
+        }) + "\n```"
+        parser = JSONArrayStreamParser(key="recommendations")
+
+        # Act
+        objects = []
+        for i in range(0, len(document), chunk_size):
+            objects += parser.feed(document[i:i + chunk_size])
+
+        # Assert
+        assert [obj["id"] for obj in objects] == ["R1", "R2"]
+        assert objects[0]["nested"] == {"a": [1, {"b": 2}]}
+        assert parser.array_closed
+
+    def test_first_object_available_before_document_ends(self):
+        # Arrange
+        parser = JSONArrayStreamParser(key="recommendations")
+
+        # Act
+        objects = parser.feed('{"recommendations": [{"id": "R1"}, {"id": "R')
+
+        # Assert
+        assert objects == [{"id": "R1"}]
+        assert not parser.array_closed
+
+    def test_top_level_array(self):
+        # Arrange
+        parser = JSONArrayStreamParser()
+
+        # Act
+        objects = parser.feed('[{"a": 1}, {"a": 2}]')
+
+        # Assert
+        assert objects == [{"a": 1}, {"a": 2}]
+        assert parser.array_closed
@@ -0,0 +1,17 @@
+
+import pytest
+
+from app.utils.money_parser import parse_money_range
+
+
+class TestParseMoneyRange:
+    @pytest.mark.parametrize("text, expected", [
+        ("9,000 - 12,000 €", (9000, 12000)),
+        ("12.000 bis 15.000 Euro", (12000, 15000)),
+        ("600 €/year", (600, 600)),
+        ("€1.5k–2k", (1500, 2000)),
+        ("N/A", (None, None)),
+        (None, (None, None)),
+    ])
+    def test_parse(self, text, expected):
+        assert parse_money_range(text) == expected
@@ -0,0 +1,50 @@
+
+import time
+import pytest
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    def test_lru_eviction_by_entries(self):
+        # Arrange
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Act
+        cache.get("a")
+        cache.set("c", 3)
+
+        # Assert
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        # Arrange
+        cache = TTLCache(max_entries=100, ttl_seconds=60, max_bytes=10)
+
+        # Act
+        cache.set("a", "x", size=6)
+        cache.set("b", "y", size=6)
+        stored = cache.set("c", "z", size=11)
+
+        # Assert
+        assert not stored
+        assert "a" not in cache
+        assert cache.stats()["bytes"] == 6
+
+    def test_expired_entries_are_misses(self):
+        # Arrange
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        cache.set("a", 1, ttl_seconds=0.01)
+
+        # Act
+        time.sleep(0.02)
+        value = cache.get("a")
+
+        # Assert
+        assert value is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["misses"] == 1
@@ -36,9 +36,22 @@ export interface Recommendation {
   category: 'heating' | 'insulation' | 'windows' | 'appliances' | 'habits' | 'renewable';
 }
 
+export interface GenerationProgress {
+  tokens: number;
+  tokens_per_second: number;
+  elapsed_ms: number;
+}
+
+export interface QueueStatus {
+  position: number;
+  estimated_wait_seconds: number;
+}
+
 export interface SSEMessage {
-  type: 'connected' | 'recommendation' | 'complete' | 'error';
+  type: 'connected' | 'queued' | 'recommendation' | 'progress' | 'complete' | 'error';
   recommendation?: Recommendation;
+  progress?: GenerationProgress;
+  queue?: QueueStatus;
   home_id?: string;
   error?: string;
 }